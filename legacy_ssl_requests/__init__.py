@@ -11,6 +11,7 @@ from .legacy_ssl_requests import (
     PACProxyResolver,
     TLSv1Adapter,
     TLSv11Adapter,
+    close_default_session,
     create_legacy_pac_session,
     create_legacy_session,
     create_pac_session,
@@ -28,6 +29,7 @@ __all__ = [
     "create_legacy_pac_session",
     "legacy_get",
     "legacy_post",
+    "close_default_session",
 ]
 
 __version__ = "1.0.0"
@@ -13,21 +13,105 @@ Note:
 
 from __future__ import annotations
 
+import copy
+import functools
 import ssl
+import threading
 import warnings
+from collections import OrderedDict
 from typing import Any
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
 import requests
 import urllib3
 from requests.adapters import HTTPAdapter
-from urllib3.util.ssl_ import create_urllib3_context
+from requests.cookies import RequestsCookieJar
+from requests.hooks import default_hooks
+from urllib3.util.retry import Retry
+
+# pypac is optional; it is only needed for the PAC features
+try:
+    from pypac import PACSession, get_pac
+    from pypac.parser import PACFile
+except ImportError:
+    PACSession = get_pac = PACFile = None
 
 # =============================================================================
 # SSL/TLS Configuration
 # =============================================================================
 
 
+# Protocol constants accepted as ssl_version, mapped to the TLS version they pin.
+_TLS_VERSIONS: dict[int, ssl.TLSVersion] = {
+    ssl.PROTOCOL_TLSv1: ssl.TLSVersion.TLSv1,
+    ssl.PROTOCOL_TLSv1_1: ssl.TLSVersion.TLSv1_1,
+    ssl.PROTOCOL_TLSv1_2: ssl.TLSVersion.TLSv1_2,
+}
+
+
+def _build_context(
+    ssl_version: int | None,
+    ciphers: str | None,
+) -> ssl.SSLContext:
+    """Create an SSL context with legacy support.
+
+    Args:
+        ssl_version: SSL/TLS version to use.
+        ciphers: Custom cipher suite string.
+
+    Returns:
+        Configured SSL context.
+    """
+    # Negotiate through the modern client method and pin the version range,
+    # so capable servers still get the best protocol OpenSSL offers
+    ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    tls_version = _TLS_VERSIONS.get(ssl_version) if ssl_version is not None else None
+    if tls_version is not None:
+        ctx.minimum_version = ctx.maximum_version = tls_version
+    else:
+        # Only the floor, not a pinned legacy version: don't warn about it
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            ctx.minimum_version = ssl.TLSVersion.TLSv1
+
+    # Enable legacy renegotiation
+    ctx.options |= ssl.OP_LEGACY_SERVER_CONNECT
+
+    # Set ciphers for legacy support
+    cipher_suite = ciphers or "DEFAULT:@SECLEVEL=1"
+    ctx.set_ciphers(cipher_suite)
+
+    # Disable hostname check for legacy servers (use with caution)
+    ctx.check_hostname = False
+    ctx.verify_mode = ssl.CERT_NONE
+
+    return ctx
+
+
+# Default pool sizes, large enough for typical thread pools hitting one host.
+DEFAULT_POOL_CONNECTIONS = 20
+DEFAULT_POOL_MAXSIZE = 20
+
+# Retry transient gateway errors on idempotent requests with a short backoff,
+# returning the last response rather than raising once retries run out. SSL
+# errors (certificate or protocol mismatches) are deterministic, so they are
+# not retried.
+DEFAULT_RETRY = Retry(
+    total=3,
+    other=0,
+    backoff_factor=0.2,
+    status_forcelist=(502, 503, 504),
+    raise_on_status=False,
+)
+
+# Headers set on factory-created sessions; asking for keep-alive explicitly
+# helps connections through legacy proxies stay pooled.
+DEFAULT_HEADERS = {
+    "Connection": "keep-alive",
+    "User-Agent": "legacy-ssl-requests/1.0",
+}
+
+
 class LegacySSLAdapter(HTTPAdapter):
     """HTTP Adapter that allows legacy SSL/TLS versions.
 
@@ -47,6 +131,9 @@ class LegacySSLAdapter(HTTPAdapter):
         self,
         ssl_version: int | None = None,
         ciphers: str | None = None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        max_retries: int | Retry | None = None,
         **kwargs: Any,
     ) -> None:
         """Initialize the adapter with custom SSL settings.
@@ -56,10 +143,19 @@ class LegacySSLAdapter(HTTPAdapter):
                         If None, uses default with legacy support enabled.
             ciphers: Custom cipher suite string.
                     If None, uses DEFAULT:@SECLEVEL=1 for legacy support.
+            pool_connections: Number of host connection pools to cache.
+            pool_maxsize: Maximum number of connections kept per pool.
+            max_retries: Retry count or urllib3 Retry configuration.
+                        If None, uses DEFAULT_RETRY.
             **kwargs: Additional arguments passed to HTTPAdapter.
         """
         self.ssl_context = self._create_legacy_context(ssl_version, ciphers)
-        super().__init__(**kwargs)
+        super().__init__(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=DEFAULT_RETRY if max_retries is None else max_retries,
+            **kwargs,
+        )
 
     def _create_legacy_context(
         self,
@@ -75,24 +171,7 @@ class LegacySSLAdapter(HTTPAdapter):
         Returns:
             Configured SSL context.
         """
-        # Create context with specified version or default
-        if ssl_version is not None:
-            ctx = ssl.SSLContext(ssl_version)
-        else:
-            ctx = create_urllib3_context()
-
-        # Enable legacy renegotiation
-        ctx.options |= ssl.OP_LEGACY_SERVER_CONNECT
-
-        # Set ciphers for legacy support
-        cipher_suite = ciphers or "DEFAULT:@SECLEVEL=1"
-        ctx.set_ciphers(cipher_suite)
-
-        # Disable hostname check for legacy servers (use with caution)
-        ctx.check_hostname = False
-        ctx.verify_mode = ssl.CERT_NONE
-
-        return ctx
+        return _build_context(ssl_version, ciphers)
 
     def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
         """Initialize pool manager with custom SSL context.
@@ -170,16 +249,117 @@ class TLSv11Adapter(LegacySSLAdapter):
         super().__init__(ssl_version=ssl.PROTOCOL_TLSv1_1, **kwargs)
 
 
+class _SharedAdapterMixin:
+    """Keep the pools open when a session using a shared adapter closes.
+
+    Factory-created sessions share adapters, so one session's close() must
+    not drop the pooled connections of the others. The pools live as long
+    as the process.
+    """
+
+    def close(self) -> None:
+        """Leave the shared connection pools open."""
+
+
+class _SharedLegacySSLAdapter(_SharedAdapterMixin, LegacySSLAdapter):
+    """LegacySSLAdapter shared between factory-created sessions."""
+
+
+class _SharedHTTPAdapter(_SharedAdapterMixin, HTTPAdapter):
+    """Plain HTTP adapter shared between factory-created sessions."""
+
+
+# Adapters mounted by the session factories, shared per configuration so all
+# sessions draw from the same connection pools.
+_adapter_cache: dict[
+    tuple[bool, int | None, str | None, int, int, int | None],
+    LegacySSLAdapter,
+] = {}
+_adapter_cache_lock = threading.Lock()
+
+
+def _get_adapter(
+    verify_ssl: bool,
+    ssl_version: int | None = None,
+    ciphers: str | None = None,
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    max_retries: int | Retry | None = None,
+) -> LegacySSLAdapter:
+    """Return the shared LegacySSLAdapter for the given settings.
+
+    The adapter owns the connection pools, so they outlive any one session:
+    closing a session leaves them open for the others. Sessions with different
+    verify_ssl values never share an adapter. A custom Retry object gets an
+    adapter of its own, since Retry instances only compare by identity.
+
+    The adapter's SSL context is shared along with it, and urllib3 applies
+    the verify mode, CA bundle and client certificate to that context on
+    every connection. A session that changes verify or cert after creation
+    should mount its own LegacySSLAdapter.
+
+    Args:
+        verify_ssl: Whether the sessions using the adapter verify certificates.
+        ssl_version: SSL/TLS version to use.
+        ciphers: Custom cipher suite string.
+        pool_connections: Number of host connection pools to cache.
+        pool_maxsize: Maximum number of connections kept per pool.
+        max_retries: Retry count or urllib3 Retry configuration.
+
+    Returns:
+        Shared adapter instance.
+    """
+    if isinstance(max_retries, Retry):
+        return LegacySSLAdapter(
+            ssl_version=ssl_version,
+            ciphers=ciphers,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=max_retries,
+        )
+
+    key = (
+        verify_ssl,
+        ssl_version,
+        ciphers,
+        pool_connections,
+        pool_maxsize,
+        max_retries,
+    )
+    with _adapter_cache_lock:
+        adapter = _adapter_cache.get(key)
+        if adapter is None:
+            adapter = _SharedLegacySSLAdapter(
+                ssl_version=ssl_version,
+                ciphers=ciphers,
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                max_retries=max_retries,
+            )
+            _adapter_cache[key] = adapter
+        return adapter
+
+
 # =============================================================================
 # PAC (Proxy Auto-Configuration) Support
 # =============================================================================
 
+# PAC results meaning "connect directly"; resolved to None without parsing.
+_DIRECT_RESULTS = frozenset({"DIRECT", "", None})
+
+# Maximum number of URLs whose PAC result each PACProxyResolver remembers.
+PAC_CACHE_SIZE = 256
+
 
 def create_pac_session(
     pac_url: str | None = None,
     pac_file_path: str | None = None,
     use_system_pac: bool = False,
     legacy_ssl: bool = False,
+    verify_ssl: bool = True,
+    ciphers: str | None = None,
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
 ) -> requests.Session:
     """Create a requests session with PAC proxy support.
 
@@ -191,6 +371,12 @@ def create_pac_session(
         pac_file_path: Local path to a PAC file.
         use_system_pac: If True, use the system's configured PAC.
         legacy_ssl: If True, enable legacy SSL support.
+        verify_ssl: Whether to verify SSL certificates.
+        ciphers: Custom cipher suite string, used when legacy_ssl is True.
+        pool_connections: Number of host connection pools to cache, used
+            when legacy_ssl is True.
+        pool_maxsize: Maximum number of connections kept per pool, used when
+            legacy_ssl is True.
 
     Returns:
         Configured requests Session with PAC support.
@@ -208,20 +394,17 @@ def create_pac_session(
         >>> session = create_pac_session(use_system_pac=True)
         >>> response = session.get("https://example.com")
     """
-    try:
-        from pypac import PACSession, get_pac
-        from pypac.parser import PACFile
-    except ImportError as e:
+    if get_pac is None or PACFile is None or PACSession is None:
         raise ImportError(
             "pypac is required for PAC support. Install with: pip install pypac"
-        ) from e
+        )
 
     # Load PAC from specified source
     if pac_url:
         pac = get_pac(url=pac_url)
     elif pac_file_path:
-        with open(pac_file_path, "r", encoding="utf-8") as f:
-            pac_content = f.read()
+        with open(pac_file_path, "rb") as f:
+            pac_content = f.read().decode("utf-8")
         pac = PACFile(pac_content)
     elif use_system_pac:
         pac = get_pac()
@@ -230,10 +413,17 @@ def create_pac_session(
 
     # Create PAC session
     session = PACSession(pac)
+    session.headers.update(DEFAULT_HEADERS)
+    session.verify = verify_ssl
 
     # Add legacy SSL support if requested
     if legacy_ssl:
-        adapter = LegacySSLAdapter()
+        adapter = _get_adapter(
+            verify_ssl,
+            ciphers=ciphers,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+        )
         session.mount("https://", adapter)
 
     return session
@@ -243,7 +433,10 @@ class PACProxyResolver:
     """Resolve proxy settings using a PAC file.
 
     This class provides manual PAC resolution for cases where you need
-    more control over proxy selection.
+    more control over proxy selection. Results are cached per URL (up to
+    PAC_CACHE_SIZE, least recently used first out). PAC rules may look at
+    the whole URL, so a host is not cached as a unit: repeated lookups of
+    the same URL skip the PAC script, but each new path on a host runs it.
 
     Attributes:
         pac: The loaded PAC file object.
@@ -252,8 +445,14 @@ class PACProxyResolver:
         >>> resolver = PACProxyResolver(pac_url="http://proxy.example.com/proxy.pac")
         >>> proxy = resolver.get_proxy_for_url("https://example.com")
         >>> print(proxy)  # {'https': 'http://proxy.example.com:8080'}
+
+    Note:
+        The class defines __slots__; subclasses adding attributes must
+        declare their own.
     """
 
+    __slots__ = ("_cache", "pac")
+
     def __init__(
         self,
         pac_url: str | None = None,
@@ -271,19 +470,16 @@ class PACProxyResolver:
             ValueError: If no PAC source is specified.
             ImportError: If pypac is not installed.
         """
-        try:
-            from pypac import get_pac
-            from pypac.parser import PACFile
-        except ImportError as e:
+        if get_pac is None or PACFile is None:
             raise ImportError(
                 "pypac is required for PAC support. Install with: pip install pypac"
-            ) from e
+            )
 
         if pac_url:
             self.pac = get_pac(url=pac_url)
         elif pac_file_path:
-            with open(pac_file_path, "r", encoding="utf-8") as f:
-                pac_content = f.read()
+            with open(pac_file_path, "rb") as f:
+                pac_content = f.read().decode("utf-8")
             self.pac = PACFile(pac_content)
         elif use_system_pac:
             self.pac = get_pac()
@@ -292,6 +488,8 @@ class PACProxyResolver:
                 "Must specify pac_url, pac_file_path, or use_system_pac=True"
             )
 
+        self._cache = functools.lru_cache(maxsize=PAC_CACHE_SIZE)(self._resolve)
+
     def get_proxy_for_url(self, url: str) -> dict[str, str] | None:
         """Get proxy settings for a given URL.
 
@@ -308,36 +506,105 @@ class PACProxyResolver:
         if self.pac is None:
             return None
 
-        result = self.pac.find_proxy_for_url(url, urlparse(url).netloc)
+        proxy_url = self._cache(url)
 
-        if result == "DIRECT" or result is None:
+        # requests adds environment proxies to the dict it is given, so every
+        # caller gets a fresh one
+        if proxy_url is None:
             return None
+        return {"http": proxy_url, "https": proxy_url}
+
+    def clear_cache(self) -> None:
+        """Discard cached proxy settings, e.g. after the PAC file changes."""
+        self._cache.cache_clear()
 
-        # Parse PAC result (e.g., "PROXY proxy.example.com:8080")
-        proxies: dict[str, str] = {}
-        for proxy_entry in result.split(";"):
+    def _resolve(self, url: str) -> str | None:
+        """Evaluate the PAC script and parse its result.
+
+        Args:
+            url: The URL to get proxy settings for.
+
+        Returns:
+            Proxy URL or None if direct connection.
+        """
+        result = self.pac.find_proxy_for_url(url, urlsplit(url).netloc)
+
+        if result in _DIRECT_RESULTS:
+            return None
+
+        # Parse PAC result (e.g., "PROXY proxy.example.com:8080"); entries
+        # are listed in order of preference, so the first usable one wins
+        remainder = result
+        while remainder:
+            proxy_entry, _, remainder = remainder.partition(";")
             proxy_entry = proxy_entry.strip()
-            if proxy_entry.upper().startswith("PROXY "):
-                proxy_addr = proxy_entry[6:].strip()
-                proxies["http"] = f"http://{proxy_addr}"
-                proxies["https"] = f"http://{proxy_addr}"
-            elif proxy_entry.upper().startswith("SOCKS "):
-                proxy_addr = proxy_entry[6:].strip()
-                proxies["http"] = f"socks5://{proxy_addr}"
-                proxies["https"] = f"socks5://{proxy_addr}"
+            prefix = proxy_entry[:6].upper()
+            if prefix == "DIRECT" and len(proxy_entry) == 6:
+                return None
+            if prefix == "PROXY ":
+                scheme = "http"
+            elif prefix == "SOCKS ":
+                scheme = "socks5"
+            else:
+                continue
+            return f"{scheme}://{proxy_entry[6:].strip()}"
 
-        return proxies if proxies else None
+        return None
 
 
 # =============================================================================
 # Convenience Functions
 # =============================================================================
 
+_warnings_disabled = False
+_warnings_lock = threading.Lock()
+
+
+def _disable_warnings_once() -> None:
+    """Suppress InsecureRequestWarning, touching the warnings filters once."""
+    global _warnings_disabled
+    if _warnings_disabled:
+        return
+    with _warnings_lock:
+        if not _warnings_disabled:
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+            _warnings_disabled = True
+
+
+# Fully initialized session that create_legacy_session() copies, skipping the
+# Session constructor (default adapters, cookie jar, ...) on every call.
+_template_session = requests.Session()
+_template_session.headers.update(DEFAULT_HEADERS)
+_template_session.mount("http://", _SharedHTTPAdapter())
+
+
+def _copy_template_session() -> requests.Session:
+    """Return a new session cloned from the template session.
+
+    Mutable state (headers, cookies, hooks, proxies, params and the adapter
+    mapping) is copied so sessions never affect each other; the adapters
+    themselves are shared and survive the session being closed.
+
+    Returns:
+        New requests Session.
+    """
+    session = copy.copy(_template_session)
+    session.headers = _template_session.headers.copy()
+    session.cookies = RequestsCookieJar()
+    session.hooks = default_hooks()
+    session.proxies = {}
+    session.params = {}
+    session.adapters = OrderedDict(_template_session.adapters)
+    return session
+
 
 def create_legacy_session(
     verify_ssl: bool = False,
     ssl_version: int | None = None,
     ciphers: str | None = None,
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    max_retries: int | Retry | None = None,
 ) -> requests.Session:
     """Create a requests session with legacy SSL support.
 
@@ -345,6 +612,9 @@ def create_legacy_session(
         verify_ssl: Whether to verify SSL certificates.
         ssl_version: Specific SSL/TLS version to use.
         ciphers: Custom cipher suite string.
+        pool_connections: Number of host connection pools to cache.
+        pool_maxsize: Maximum number of connections kept per pool.
+        max_retries: Retry count or urllib3 Retry configuration.
 
     Returns:
         Configured requests Session.
@@ -354,23 +624,67 @@ def create_legacy_session(
         >>> response = session.get("https://legacy-server.example.com")
     """
     # Suppress InsecureRequestWarning
-    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-
-    session = requests.Session()
-    adapter = LegacySSLAdapter(ssl_version=ssl_version, ciphers=ciphers)
+    _disable_warnings_once()
+
+    session = _copy_template_session()
+    adapter = _get_adapter(
+        verify_ssl,
+        ssl_version=ssl_version,
+        ciphers=ciphers,
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=max_retries,
+    )
     session.mount("https://", adapter)
     session.verify = verify_ssl
 
     return session
 
 
+# Shared session for the one-off helpers, so repeated calls reuse pooled
+# keep-alive connections instead of paying a TLS handshake each time.
+_default_session: requests.Session | None = None
+_default_session_lock = threading.Lock()
+
+
+def _get_default_session() -> requests.Session:
+    """Return the shared legacy session, creating it on first use.
+
+    Returns:
+        Module-wide requests Session with legacy SSL support.
+    """
+    global _default_session
+    if _default_session is None:
+        with _default_session_lock:
+            if _default_session is None:
+                _default_session = create_legacy_session()
+    return _default_session
+
+
+def close_default_session() -> None:
+    """Close the shared session used by legacy_get() and legacy_post().
+
+    A new session is created on the next call to either helper.
+
+    Example:
+        >>> response = legacy_get("https://legacy-server.example.com/api")
+        >>> close_default_session()
+    """
+    global _default_session
+    with _default_session_lock:
+        if _default_session is not None:
+            _default_session.close()
+            _default_session = None
+
+
 def legacy_get(
     url: str,
     **kwargs: Any,
 ) -> requests.Response:
     """Make a GET request with legacy SSL support.
 
-    This is a convenience function for one-off requests.
+    This is a convenience function for one-off requests. Calls share a
+    module-wide session, so connections to the same host are reused.
 
     Args:
         url: URL to request.
@@ -383,8 +697,7 @@ def legacy_get(
         >>> response = legacy_get("https://legacy-server.example.com/api")
         >>> print(response.json())
     """
-    session = create_legacy_session()
-    return session.get(url, **kwargs)
+    return _get_default_session().get(url, **kwargs)
 
 
 def legacy_post(
@@ -410,8 +723,7 @@ def legacy_post(
         ...     json={"key": "value"}
         ... )
     """
-    session = create_legacy_session()
-    return session.post(url, data=data, json=json, **kwargs)
+    return _get_default_session().post(url, data=data, json=json, **kwargs)
 
 
 # =============================================================================
@@ -425,6 +737,8 @@ def create_legacy_pac_session(
     use_system_pac: bool = False,
     verify_ssl: bool = False,
     ciphers: str | None = None,
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
 ) -> requests.Session:
     """Create a session with both legacy SSL and PAC support.
 
@@ -436,6 +750,8 @@ def create_legacy_pac_session(
         use_system_pac: If True, use the system's configured PAC.
         verify_ssl: Whether to verify SSL certificates.
         ciphers: Custom cipher suite string.
+        pool_connections: Number of host connection pools to cache.
+        pool_maxsize: Maximum number of connections kept per pool.
 
     Returns:
         Configured requests Session with both features.
@@ -448,7 +764,7 @@ def create_legacy_pac_session(
         >>> response = session.get("https://legacy-internal-server.local")
     """
     # Suppress warnings
-    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    _disable_warnings_once()
 
     # Create PAC session
     session = create_pac_session(
@@ -456,15 +772,12 @@ def create_legacy_pac_session(
         pac_file_path=pac_file_path,
         use_system_pac=use_system_pac,
         legacy_ssl=True,
+        verify_ssl=verify_ssl,
+        ciphers=ciphers,
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
     )
 
-    # Override adapter with custom ciphers if specified
-    if ciphers:
-        adapter = LegacySSLAdapter(ciphers=ciphers)
-        session.mount("https://", adapter)
-
-    session.verify = verify_ssl
-
     return session
 
 